@@ -6,24 +6,32 @@ Exonian Article Workflow Bot (safe version)
 - /new_article         : create private channel for an article
 - /archive             : archive a channel (read-only for all but Editors)
 - /list_articles       : list active articles + deadlines
-- Auto-sweeper (5 min) : auto-archive past deadline (safety net)
+- Auto-sweeper         : auto-archive at the next deadline (safety net)
 
 Requires:
   pip3 install -U discord.py
+  pip3 install orjson      (optional, faster config load/save)
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import re
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 
 import discord
 from discord import app_commands
-from discord.ext import tasks
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json works the same
+    orjson = None
 
 # -------------------- CONFIG --------------------
 
@@ -31,75 +39,161 @@ TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 
 CONFIG_PATH = Path("exonian_config.json")
 
-@dataclass
+def _dump_json(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+def _load_json(raw: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+@dataclass(slots=True)
 class BotConfig:
     guild_id: Optional[int] = None
     active_category_name: str = "Active Articles"
     archived_category_name: str = "Archived Articles"
     editors_role_name: str = "Editors"
+    # Resolved ids, so lookups are O(1) and survive renames
+    active_category_id: Optional[int] = None
+    archived_category_id: Optional[int] = None
+    editors_role_id: Optional[int] = None
 
     def save(self) -> None:
-        CONFIG_PATH.write_text(json.dumps(asdict(self), indent=2))
+        global _cached_cfg, _cached_mtime, _last_serialized
+        data = _dump_json(asdict(self))
+        if data == _last_serialized and CONFIG_PATH.exists():
+            return
+        # Write to a temp file and swap it in so readers never see a half-written file
+        tmp = CONFIG_PATH.with_name(CONFIG_PATH.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, CONFIG_PATH)
+        _last_serialized = data
+        _cached_cfg = self
+        _cached_mtime = CONFIG_PATH.stat().st_mtime
 
     @staticmethod
     def load() -> "BotConfig":
-        if CONFIG_PATH.exists():
-            try:
-                data = json.loads(CONFIG_PATH.read_text())
-                return BotConfig(**data)
-            except Exception:
-                pass
-        return BotConfig()
+        global _cached_cfg, _cached_mtime, _last_serialized
+        try:
+            mtime = CONFIG_PATH.stat().st_mtime
+        except OSError:
+            return BotConfig()
+        if _cached_cfg is not None and mtime == _cached_mtime:
+            return _cached_cfg
+        try:
+            raw = CONFIG_PATH.read_bytes()
+            cfg = BotConfig(**_load_json(raw))
+        except Exception:
+            return BotConfig()
+        _cached_cfg, _cached_mtime, _last_serialized = cfg, mtime, raw
+        return cfg
+
+# Last config loaded from / written to disk, keyed by the file's mtime
+_cached_cfg: Optional[BotConfig] = None
+_cached_mtime: float = 0.0
+_last_serialized: Optional[bytes] = None
 
 config = BotConfig.load()
 
 # -------------------- UTILITIES --------------------
 
+# Same split as str.isalnum(): keeps non-ASCII letters, which Discord channel names allow
+_SLUG_RE = re.compile(r"[\W_]+")
+
 def slugify(title: str) -> str:
-    s = "".join(ch.lower() if ch.isalnum() else "-" for ch in title).strip("-")
-    while "--" in s:
-        s = s.replace("--", "-")
-    return s[:90] if s else "article"
+    # One pass: every run of non-alphanumerics collapses to a single dash
+    s = _SLUG_RE.sub("-", title.lower()).strip("-")
+    return s[:90] or "article"
 
+# (format, has_year) — formats without a year assume the current one
 _DATE_FORMATS = [
-    "%Y-%m-%d %H:%M",      # 2025-09-07 23:00
-    "%Y-%m-%d",            # 2025-09-07
-    "%b %d %Y %H:%M",      # Sep 7 2025 23:00
-    "%b %d %H:%M",         # Sep 7 23:00  (assumes current year)
+    ("%Y-%m-%d %H:%M", True),     # 2025-09-07 23:00
+    ("%Y-%m-%d", True),           # 2025-09-07
+    ("%b %d %Y %H:%M", True),     # Sep 7 2025 23:00
+    ("%b %d %H:%M", False),       # Sep 7 23:00  (assumes current year)
 ]
 
 def parse_when(s: str) -> Optional[datetime]:
     s = s.strip()
+    # Fast path: ISO dates ("2025-09-07", "2025-09-07 23:00") parse in C without strptime
+    try:
+        dt = datetime.fromisoformat(s)
+        if dt.tzinfo is None:
+            return dt
+    except ValueError:
+        pass
     now = datetime.now()
-    for fmt in _DATE_FORMATS:
+    for fmt, has_year in _DATE_FORMATS:
         try:
             dt = datetime.strptime(s, fmt)
-            if "%Y" not in fmt:
+            if not has_year:
                 dt = dt.replace(year=now.year)
             return dt
         except ValueError:
             continue
     return None
 
+_MENTION_RE = re.compile(r"<@!?(\d+)>")
+
 DEADLINE_TAG = "[deadline: "
 
-def extract_deadline_from_topic(topic: Optional[str]) -> Optional[datetime]:
-    if not topic or DEADLINE_TAG not in topic:
+@lru_cache(maxsize=512)
+def _parse_deadline_topic(topic: str) -> Optional[datetime]:
+    if DEADLINE_TAG not in topic:
         return None
     try:
         start = topic.index(DEADLINE_TAG) + len(DEADLINE_TAG)
         end = topic.index("]", start)
-        return datetime.fromisoformat(topic[start:end])
+        raw = topic[start:end]
+        if raw.isdigit():
+            return datetime.fromtimestamp(int(raw))
+        # Channels created before deadlines were stored as Unix timestamps
+        return datetime.fromisoformat(raw)
     except Exception:
         return None
 
+def extract_deadline_from_topic(topic: Optional[str]) -> Optional[datetime]:
+    if not topic:
+        return None
+    return _parse_deadline_topic(topic)
+
+# Shared, never mutated: reused for every target instead of allocating per member
+_OW_HIDE = discord.PermissionOverwrite(view_channel=False)
+_OW_VIEW_ONLY = discord.PermissionOverwrite(view_channel=True, send_messages=False, read_message_history=True)
+_OW_VIEW_NO_SEND = discord.PermissionOverwrite(view_channel=True, send_messages=False)
+_OW_WRITER = discord.PermissionOverwrite(view_channel=True, send_messages=True, read_message_history=True)
+_OW_EDITOR = discord.PermissionOverwrite(
+    view_channel=True, send_messages=True, read_message_history=True, manage_messages=True
+)
+
+def _cached_category(guild: discord.Guild, channel_id: Optional[int]) -> Optional[discord.CategoryChannel]:
+    ch = guild.get_channel(channel_id) if channel_id else None
+    return ch if isinstance(ch, discord.CategoryChannel) else None
+
 async def ensure_categories(guild: discord.Guild) -> tuple[discord.CategoryChannel, discord.CategoryChannel]:
-    active = discord.utils.get(guild.categories, name=config.active_category_name)
-    archived = discord.utils.get(guild.categories, name=config.archived_category_name)
+    active = _cached_category(guild, config.active_category_id)
+    archived = _cached_category(guild, config.archived_category_id)
+    if active is None or archived is None:
+        # One pass over the category list for both names
+        wanted = {config.active_category_name, config.archived_category_name}
+        found: dict[str, discord.CategoryChannel] = {}
+        for c in guild.categories:
+            if c.name in wanted and c.name not in found:
+                found[c.name] = c
+        if active is None:
+            active = found.get(config.active_category_name)
+        if archived is None:
+            archived = found.get(config.archived_category_name)
     if active is None:
         active = await guild.create_category(config.active_category_name, reason="Setup Active Articles")
     if archived is None:
         archived = await guild.create_category(config.archived_category_name, reason="Setup Archived Articles")
+    if guild.id == config.guild_id:
+        config.active_category_id = active.id
+        config.archived_category_id = archived.id
+        config.save()
     return active, archived
 
 async def get_or_create_role(guild: discord.Guild, name: str) -> discord.Role:
@@ -108,14 +202,36 @@ async def get_or_create_role(guild: discord.Guild, name: str) -> discord.Role:
         role = await guild.create_role(name=name, reason="Exonian workflow bot setup")
     return role
 
-# -------------------- BOT --------------------
+def get_editors_role(guild: discord.Guild) -> Optional[discord.Role]:
+    role = guild.get_role(config.editors_role_id) if config.editors_role_id else None
+    if role is None:
+        role = discord.utils.get(guild.roles, name=config.editors_role_name)
+        if role is not None and guild.id == config.guild_id:
+            config.editors_role_id = role.id
+            config.save()
+    return role
 
-intents = discord.Intents.default()
-intents.members = True
-intents.guilds = True
+def _build_archived_overwrites(
+    ch: discord.TextChannel, guild: discord.Guild, editors_role: Optional[discord.Role]
+) -> dict:
+    """Lock posting: everyone can view but not send; only Editors can post."""
+    cleaned: dict = {}
+    targets = list(ch.overwrites)
+    if guild.default_role not in targets:
+        targets.insert(0, guild.default_role)
+    for target in targets:
+        if isinstance(target, discord.Role) and editors_role and target.id == editors_role.id:
+            cleaned[target] = _OW_WRITER
+        elif isinstance(target, (discord.Member, discord.Role)):
+            cleaned[target] = _OW_VIEW_ONLY
+        else:
+            cleaned[target] = _OW_VIEW_NO_SEND
+    return cleaned
+
+# -------------------- BOT --------------------
 
 class ExonianBot(discord.Client):
-    def __init__(self) -> None:
+    def __init__(self, intents: discord.Intents) -> None:
         super().__init__(intents=intents)
         self.tree = app_commands.CommandTree(self)
 
@@ -127,252 +243,255 @@ class ExonianBot(discord.Client):
             await self.tree.sync(guild=guild)
         else:
             await self.tree.sync()
-        sweeper.start()
+        self.sweeper_task = asyncio.create_task(sweeper(self))
 
-bot = ExonianBot()
+def build_bot() -> ExonianBot:
+    """Create the client; kept out of import time so the helpers can be imported without a token."""
+    intents = discord.Intents.default()
+    intents.members = True
+    intents.guilds = True
+    return ExonianBot(intents=intents)
 
 # -------------------- COMMANDS --------------------
 
-@bot.tree.command(name="ping", description="Test if bot is alive")
-async def ping(interaction: discord.Interaction):
-    await interaction.response.send_message("Pong!", ephemeral=True)
-
-@bot.tree.command(name="sync_here", description="Force-sync commands to this server (admin only)")
-@app_commands.checks.has_permissions(administrator=True)
-async def sync_here(interaction: discord.Interaction):
-    await interaction.response.defer(ephemeral=True, thinking=True)
-    await bot.tree.sync(guild=interaction.guild)
-    await interaction.followup.send("Commands synced to this server.", ephemeral=True)
-
-@bot.tree.command(description="Initialize categories and set this guild as default.")
-async def setup(interaction: discord.Interaction):
-    # Acknowledge fast so Discord doesn't time out
-    await interaction.response.defer(ephemeral=True, thinking=True)
-
-    config.guild_id = interaction.guild_id
-    active, archived = await ensure_categories(interaction.guild)
-    editors = await get_or_create_role(interaction.guild, config.editors_role_name)
-    config.save()
-
-    msg = (
-        f"Setup complete.\n"
-        f"Active: {active.name}\n"
-        f"Archived: {archived.name}\n"
-        f"Editors role: {editors.mention}"
-    )
-    await interaction.followup.send(msg, ephemeral=True)
-
-@bot.tree.command(name="list_articles", description="List active article channels and deadlines")
-async def list_articles(interaction: discord.Interaction):
-    await interaction.response.defer(ephemeral=True, thinking=True)
-    guild = interaction.guild
-    if guild is None:
-        await interaction.followup.send("This command must be used in a server.", ephemeral=True)
-        return
+def register_commands(bot: ExonianBot) -> None:
+    @bot.tree.command(name="ping", description="Test if bot is alive")
+    async def ping(interaction: discord.Interaction):
+        await interaction.response.send_message("Pong!", ephemeral=True)
+
+    @bot.tree.command(name="sync_here", description="Force-sync commands to this server (admin only)")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def sync_here(interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        await bot.tree.sync(guild=interaction.guild)
+        await interaction.followup.send("Commands synced to this server.", ephemeral=True)
+
+    @bot.tree.command(description="Initialize categories and set this guild as default.")
+    async def setup(interaction: discord.Interaction):
+        # Acknowledge fast so Discord doesn't time out
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        config.guild_id = interaction.guild_id
+        active, archived = await ensure_categories(interaction.guild)
+        editors = await get_or_create_role(interaction.guild, config.editors_role_name)
+        config.editors_role_id = editors.id
+        config.save()
+
+        msg = (
+            f"Setup complete.\n"
+            f"Active: {active.name}\n"
+            f"Archived: {archived.name}\n"
+            f"Editors role: {editors.mention}"
+        )
+        await interaction.followup.send(msg, ephemeral=True)
 
-    active_cat, _ = await ensure_categories(guild)
-    lines: List[str] = []
-    for ch in active_cat.text_channels:
-        dl = extract_deadline_from_topic(ch.topic)
-        if dl:
-            lines.append(f"• {ch.mention} — deadline <t:{int(dl.timestamp())}:R>")
-        else:
-            lines.append(f"• {ch.mention} — no deadline")
-    if not lines:
-        await interaction.followup.send("No active article channels.", ephemeral=True)
-    else:
-        await interaction.followup.send("\n".join(lines), ephemeral=True)
-
-@bot.tree.command(name="new_article", description="Create a private channel for an article")
-@app_commands.describe(
-    title="Article title",
-    deadline="Deadline (e.g., '2025-09-07 23:00' or 'Sep 7 23:00')",
-    writers="Mention users separated by spaces",
-)
-async def new_article(
-    interaction: discord.Interaction,
-    title: str,
-    deadline: str,
-    writers: Optional[str] = None,
-):
-    await interaction.response.defer(ephemeral=True, thinking=True)
-    try:
+    @bot.tree.command(name="list_articles", description="List active article channels and deadlines")
+    async def list_articles(interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True, thinking=True)
         guild = interaction.guild
         if guild is None:
             await interaction.followup.send("This command must be used in a server.", ephemeral=True)
             return
 
-        dt = parse_when(deadline)
-        if not dt:
-            await interaction.followup.send("Couldn't parse the deadline. Use `YYYY-MM-DD HH:MM` (24-hour).", ephemeral=True)
-            return
-
         active_cat, _ = await ensure_categories(guild)
-        editors_role = discord.utils.get(guild.roles, name=config.editors_role_name)
-
-        channel_name = slugify(title)
-        overwrites: dict = {guild.default_role: discord.PermissionOverwrite(view_channel=False)}
-        if editors_role:
-            overwrites[editors_role] = discord.PermissionOverwrite(
-                view_channel=True, send_messages=True, read_message_history=True, manage_messages=True
-            )
-
-        user_ids: List[int] = []
-        if writers:
-            for mention in writers.split():
-                if mention.startswith("<@") and mention.endswith(">"):
-                    stripped = mention.strip("<@!>")
-                    if stripped.isdigit():
-                        user_ids.append(int(stripped))
-
-        allowed_users: List[discord.Member] = []
-        for uid in set(user_ids):
-            member = guild.get_member(uid) or await guild.fetch_member(uid)
-            if member:
-                allowed_users.append(member)
-                overwrites[member] = discord.PermissionOverwrite(
-                    view_channel=True, send_messages=True, read_message_history=True
-                )
-
-        topic = f"Article: {title} | {DEADLINE_TAG}{dt.isoformat()}]"
-        channel = await guild.create_text_channel(
-            name=channel_name,
-            category=active_cat,
-            overwrites=overwrites,
-            topic=topic,
-            reason=f"Article channel for '{title}'",
-        )
+        lines: List[str] = [
+            f"• {ch.mention} — "
+            + (f"deadline <t:{int(dl.timestamp())}:R>" if (dl := extract_deadline_from_topic(ch.topic)) else "no deadline")
+            for ch in active_cat.text_channels
+        ]
+        if not lines:
+            await interaction.followup.send("No active article channels.", ephemeral=True)
+        else:
+            await interaction.followup.send("\n".join(lines), ephemeral=True)
 
-        checklist = (
-            f"**Article:** {title}\n"
-            f"**Writers:** {' '.join(writers.split()) if writers else '—'}\n"
-            f"**Deadline:** <t:{int(dt.timestamp())}:F> (<t:{int(dt.timestamp())}:R>)\n\n"
-            f"**Checklist**\n- [ ] Angle approved\n- [ ] Sources identified\n- [ ] Draft complete\n- [ ] Edited by section\n- [ ] Copy edit\n- [ ] Final publish\n"
-        )
-        msg = await channel.send(checklist)
+    @bot.tree.command(name="new_article", description="Create a private channel for an article")
+    @app_commands.describe(
+        title="Article title",
+        deadline="Deadline (e.g., '2025-09-07 23:00' or 'Sep 7 23:00')",
+        writers="Mention one or more users (any separator)",
+    )
+    async def new_article(
+        interaction: discord.Interaction,
+        title: str,
+        deadline: str,
+        writers: Optional[str] = None,
+    ):
+        await interaction.response.defer(ephemeral=True, thinking=True)
         try:
-            await msg.pin()
+            guild = interaction.guild
+            if guild is None:
+                await interaction.followup.send("This command must be used in a server.", ephemeral=True)
+                return
+
+            dt = parse_when(deadline)
+            if not dt:
+                await interaction.followup.send("Couldn't parse the deadline. Use `YYYY-MM-DD HH:MM` (24-hour).", ephemeral=True)
+                return
+
+            active_cat, _ = await ensure_categories(guild)
+            editors_role = get_editors_role(guild)
+
+            channel_name = slugify(title)
+            overwrites: dict = {guild.default_role: _OW_HIDE}
+            if editors_role:
+                overwrites[editors_role] = _OW_EDITOR
+
+            user_ids: List[int] = [int(x) for x in _MENTION_RE.findall(writers)] if writers else []
+
+            # Resolve from cache first; fetch any misses in one gateway request instead of one HTTP call each
+            allowed_users: List[discord.Member] = []
+            missing: List[int] = []
+            for uid in set(user_ids):
+                member = guild.get_member(uid)
+                if member:
+                    allowed_users.append(member)
+                else:
+                    missing.append(uid)
+            for i in range(0, len(missing), 100):
+                allowed_users.extend(await guild.query_members(user_ids=missing[i:i + 100], limit=100, cache=True))
+            for member in allowed_users:
+                overwrites[member] = _OW_WRITER
+
+            ts = int(dt.timestamp())
+            topic = f"Article: {title} | {DEADLINE_TAG}{ts}]"
+            channel = await guild.create_text_channel(
+                name=channel_name,
+                category=active_cat,
+                overwrites=overwrites,
+                topic=topic,
+                reason=f"Article channel for '{title}'",
+            )
+            note_deadline(ts)
+
+            writers_line = " ".join(m.mention for m in allowed_users) if allowed_users else "—"
+            checklist = (
+                f"**Article:** {title}\n"
+                f"**Writers:** {writers_line}\n"
+                f"**Deadline:** <t:{ts}:F> (<t:{ts}:R>)\n\n"
+                f"**Checklist**\n- [ ] Angle approved\n- [ ] Sources identified\n- [ ] Draft complete\n- [ ] Edited by section\n- [ ] Copy edit\n- [ ] Final publish\n"
+            )
+            msg = await channel.send(checklist)
+
+            # Pinning and the confirmation don't depend on each other, so overlap the two round trips.
+            # The confirmation may already be out when a pin fails, so that only leaves the checklist unpinned.
+            _pinned, sent = await asyncio.gather(
+                msg.pin(),
+                interaction.followup.send(
+                    f"Created {channel.mention} for **{title}**. Writers added: {', '.join(m.mention for m in allowed_users) if allowed_users else 'None'}",
+                    ephemeral=True,
+                ),
+                return_exceptions=True,
+            )
+            if isinstance(sent, BaseException):
+                raise sent
         except discord.Forbidden:
-            pass
-
-        await interaction.followup.send(
-            f"Created {channel.mention} for **{title}**. Writers added: {', '.join(m.mention for m in allowed_users) if allowed_users else 'None'}",
-            ephemeral=True,
-        )
-    except discord.Forbidden:
-        await interaction.followup.send(
-            "Missing permissions: the bot needs Manage Channels & Manage Roles, and its role must be above section roles.",
-            ephemeral=True,
-        )
-    except Exception as e:
-        await interaction.followup.send(f"Error while creating channel: {e.__class__.__name__}", ephemeral=True)
-
-@bot.tree.command(name="archive", description="Archive an article channel (defaults to current channel)")
-@app_commands.describe(channel="Channel to archive (optional)")
-async def archive_channel(interaction: discord.Interaction, channel: Optional[discord.TextChannel] = None):
-    await interaction.response.defer(ephemeral=True, thinking=True)
-    try:
-        guild = interaction.guild
-        if guild is None:
-            await interaction.followup.send("This command must be used in a server.", ephemeral=True)
-            return
-
-        _, archived_cat = await ensure_categories(guild)
-        ch = channel or interaction.channel
-        if not isinstance(ch, discord.TextChannel):
-            await interaction.followup.send("Choose a text channel to archive.", ephemeral=True)
-            return
-
-        # Move channel
-        await ch.edit(category=archived_cat, reason="Article archived")
+            await interaction.followup.send(
+                "Missing permissions: the bot needs Manage Channels & Manage Roles, and its role must be above section roles.",
+                ephemeral=True,
+            )
+        except Exception as e:
+            await interaction.followup.send(f"Error while creating channel: {e.__class__.__name__}", ephemeral=True)
 
-        # Lock posting: default role can view but not send; only Editors can post
-        editors_role = discord.utils.get(guild.roles, name=config.editors_role_name)
-        overwrites = ch.overwrites
+    @bot.tree.command(name="archive", description="Archive an article channel (defaults to current channel)")
+    @app_commands.describe(channel="Channel to archive (optional)")
+    async def archive_channel(interaction: discord.Interaction, channel: Optional[discord.TextChannel] = None):
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        try:
+            guild = interaction.guild
+            if guild is None:
+                await interaction.followup.send("This command must be used in a server.", ephemeral=True)
+                return
+
+            _, archived_cat = await ensure_categories(guild)
+            ch = channel or interaction.channel
+            if not isinstance(ch, discord.TextChannel):
+                await interaction.followup.send("Choose a text channel to archive.", ephemeral=True)
+                return
+
+            # Move channel and lock posting in one request: default role can view but not send; only Editors can post
+            cleaned = _build_archived_overwrites(ch, guild, get_editors_role(guild))
+            await ch.edit(category=archived_cat, overwrites=cleaned, reason="Article archived")
+            await interaction.followup.send(f"Archived {ch.mention} (posting locked; Editors can still post).", ephemeral=True)
 
-        # Ensure @everyone cannot send
-        overwrites[guild.default_role] = discord.PermissionOverwrite(
-            view_channel=True, send_messages=False, read_message_history=True
-        )
+        except discord.Forbidden:
+            await interaction.followup.send(
+                "Missing permissions: need Manage Channels, and bot role must be above section roles.",
+                ephemeral=True,
+            )
+        except Exception as e:
+            await interaction.followup.send(f"Error while archiving: {e.__class__.__name__}", ephemeral=True)
 
-        # Remove per-member send permissions and non-editor role sends
-        cleaned = {}
-        for target, _perms in overwrites.items():
-            if isinstance(target, discord.Member):
-                cleaned[target] = discord.PermissionOverwrite(
-                    view_channel=True, send_messages=False, read_message_history=True
-                )
-            elif isinstance(target, discord.Role):
-                if editors_role and target.id == editors_role.id:
-                    cleaned[target] = discord.PermissionOverwrite(
-                        view_channel=True, send_messages=True, read_message_history=True
-                    )
-                else:
-                    cleaned[target] = discord.PermissionOverwrite(
-                        view_channel=True, send_messages=False, read_message_history=True
-                    )
-            else:
-                cleaned[target] = discord.PermissionOverwrite(view_channel=True, send_messages=False)
+# -------------------- BACKGROUND TASKS --------------------
 
-        await ch.edit(overwrites=cleaned)
-        await interaction.followup.send(f"Archived {ch.mention} (posting locked; Editors can still post).", ephemeral=True)
+# The sweeper sleeps until the nearest known deadline, bounded so missed updates still get picked up
+SWEEP_MIN_INTERVAL = 60
+SWEEP_MAX_INTERVAL = 30 * 60
 
-    except discord.Forbidden:
-        await interaction.followup.send(
-            "Missing permissions: need Manage Channels, and bot role must be above section roles.",
-            ephemeral=True,
-        )
-    except Exception as e:
-        await interaction.followup.send(f"Error while archiving: {e.__class__.__name__}", ephemeral=True)
+_next_deadline_ts: Optional[float] = None
+_sweep_wakeup = asyncio.Event()
 
-# -------------------- BACKGROUND TASKS --------------------
+def note_deadline(ts: float) -> None:
+    """Tell the sweeper about a new deadline so it can wake up earlier if needed."""
+    global _next_deadline_ts
+    if _next_deadline_ts is None or ts < _next_deadline_ts:
+        _next_deadline_ts = ts
+        _sweep_wakeup.set()
 
-@tasks.loop(minutes=5)
-async def sweeper():
-    await bot.wait_until_ready()
+async def sweep_once(bot: discord.Client) -> None:
+    global _next_deadline_ts
+    _next_deadline_ts = None
     if config.guild_id is None:
         return
     guild = bot.get_guild(config.guild_id)
     if not guild:
         return
     active_cat, archived_cat = await ensure_categories(guild)
-    editors_role = discord.utils.get(guild.roles, name=config.editors_role_name)
+    editors_role = get_editors_role(guild)
     now = datetime.now()
+    upcoming: List[float] = []
     for ch in list(active_cat.text_channels):
         dl = extract_deadline_from_topic(ch.topic)
-        if dl and dl < now:
+        if dl is None:
+            continue
+        if dl >= now:
+            upcoming.append(dl.timestamp())
+            continue
+        try:
+            await ch.send("⏰ Deadline passed — archiving channel.")
+            # Move and lock posting similar to manual archive
+            cleaned = _build_archived_overwrites(ch, guild, editors_role)
+            await ch.edit(category=archived_cat, overwrites=cleaned, reason="Auto-archive past deadline")
+        except Exception:
+            continue
+    # Failed archives are retried at the safety bound rather than every minute
+    if upcoming:
+        note_deadline(min(upcoming))
+
+async def sweeper(bot: discord.Client) -> None:
+    await bot.wait_until_ready()
+    while not bot.is_closed():
+        try:
+            await sweep_once(bot)
+        except Exception:
+            pass
+        # Sleep until the next deadline; a newly created earlier deadline restarts the wait
+        while True:
+            _sweep_wakeup.clear()
+            if _next_deadline_ts is None:
+                delay = SWEEP_MAX_INTERVAL
+            else:
+                delay = _next_deadline_ts - datetime.now().timestamp()
+                delay = min(SWEEP_MAX_INTERVAL, max(SWEEP_MIN_INTERVAL, delay))
             try:
-                await ch.send("⏰ Deadline passed — archiving channel.")
-                await ch.edit(category=archived_cat, reason="Auto-archive past deadline")
-                # Lock posting similar to manual archive
-                overwrites = ch.overwrites
-                overwrites[guild.default_role] = discord.PermissionOverwrite(
-                    view_channel=True, send_messages=False, read_message_history=True
-                )
-                cleaned = {}
-                for target, _perms in overwrites.items():
-                    if isinstance(target, discord.Member):
-                        cleaned[target] = discord.PermissionOverwrite(
-                            view_channel=True, send_messages=False, read_message_history=True
-                        )
-                    elif isinstance(target, discord.Role):
-                        if editors_role and target.id == editors_role.id:
-                            cleaned[target] = discord.PermissionOverwrite(
-                                view_channel=True, send_messages=True, read_message_history=True
-                            )
-                        else:
-                            cleaned[target] = discord.PermissionOverwrite(
-                                view_channel=True, send_messages=False, read_message_history=True
-                            )
-                    else:
-                        cleaned[target] = discord.PermissionOverwrite(view_channel=True, send_messages=False)
-                await ch.edit(overwrites=cleaned)
-            except Exception:
-                continue
+                await asyncio.wait_for(_sweep_wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                break
 
 # -------------------- RUN --------------------
 
 if __name__ == "__main__":
     if not TOKEN:
         raise SystemExit("Please set the DISCORD_BOT_TOKEN environment variable.")
+    bot = build_bot()
+    register_commands(bot)
     bot.run(TOKEN)